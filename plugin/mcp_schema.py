@@ -19,6 +19,19 @@ tools = [
         "description": "List project layers (id, name, type, crs).",
         "input_schema": {"type": "object", "properties": {}},
     },
+    {
+        "name": "get_project_state",
+        "description": "Project state (crs, layers with feature counts, extents, styles) with a version. "
+                       "Pass since_version and epoch from a previous response to get only layers "
+                       "added/removed/modified since then; full=true means a full snapshot was returned instead.",
+        "input_schema": {
+            "type": "object",
+            "properties": {
+                "since_version": {"type": "integer"},
+                "epoch": {"type": "string"}
+            }
+        }
+    },
     {
         "name": "list_algorithms",
         "description": "List processing algorithms (id, name, provider).",
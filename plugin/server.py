@@ -1,9 +1,11 @@
 import asyncio
 import concurrent.futures
+import hashlib
 import json
 import os
 import uuid
 import resource
+from collections import deque
 from contextlib import asynccontextmanager
 from pathlib import Path
 from types import MappingProxyType
@@ -27,6 +29,7 @@ TCP_PROXY_PORT = 8765
 MAX_MESSAGE_SIZE = 5 * 1024 * 1024  # 5 MB
 TIMEOUT_SEC = 30
 MEMORY_LIMIT_BYTES = 1_000_000_000  # ~1 GB soft cap
+STATE_JOURNAL_SIZE = 512  # change entries kept for get_project_state deltas
 
 # Sandbox settings
 BLOCKED_MODULES = {
@@ -48,6 +51,196 @@ _extra_allow = os.environ.get('QGIS_MCP_ALLOW_DIRS')
 if _extra_allow:
     ALLOW_PATHS.extend([p for p in _extra_allow.split(':') if p])
 
+# Layer signals that mark a layer as modified in the project state journal
+LAYER_CHANGE_SIGNALS = (
+    'nameChanged',
+    'crsChanged',
+    'styleChanged',
+    'rendererChanged',
+    'dataChanged',
+    'dataSourceChanged',
+)
+# Vector-only signals covering edit-buffer changes and filters (feature count/extent)
+VECTOR_LAYER_CHANGE_SIGNALS = (
+    'layerModified',
+    'subsetStringChanged',
+    'afterCommitChanges',
+)
+
+
+class ProjectStateTracker:
+    """
+    Monotonic project version plus a bounded journal of layer changes.
+    Fed by QgsProject/layer signals; answers get_project_state with either
+    a delta since a client-supplied version or a full snapshot. Versions are
+    only comparable within one epoch (a fresh tracker starts a new one).
+    """
+
+    def __init__(self, journal_size=STATE_JOURNAL_SIZE):
+        self.epoch = uuid.uuid4().hex
+        self.version = 0
+        self._journal = deque(maxlen=journal_size)  # (version, kind, layer_id)
+        self._floor = 0  # deltas are only answerable for since_version >= floor
+        self._connections = {}  # layer id (None for project) -> [(signal, slot)]
+        self._untracked = set()  # keys with a signal we could not connect
+        self._lock = Lock()
+
+    def record(self, kind, layer_id=None):
+        with self._lock:
+            self.version += 1
+            if len(self._journal) == self._journal.maxlen:
+                self._floor = self._journal[0][0]
+            self._journal.append((self.version, kind, layer_id))
+            return self.version
+
+    def reset(self):
+        """Invalidate all deltas (project cleared or reloaded)."""
+        with self._lock:
+            self.version += 1
+            self._journal.clear()
+            self._floor = self.version
+
+    def attach(self, project):
+        self._connect(None, project, 'layersAdded', self._on_layers_added)
+        self._connect(None, project, 'layersRemoved', self._on_layers_removed)
+        self._connect(None, project, 'crsChanged', lambda *_: self.record('project'))
+        self._connect(None, project, 'cleared', lambda *_: self.reset())
+        for lyr in project.mapLayers().values():
+            self._watch_layer(lyr)
+
+    def detach(self):
+        for key in list(self._connections):
+            self._disconnect(key)
+        self._untracked.clear()
+
+    def _connect(self, key, obj, name, slot):
+        # A signal we cannot see makes deltas incomplete; state() then falls
+        # back to full snapshots while the key is untracked.
+        signal = getattr(obj, name, None)
+        try:
+            signal.connect(slot)
+        except Exception:
+            self._untracked.add(key)
+            return
+        self._connections.setdefault(key, []).append((signal, slot))
+
+    def _disconnect(self, key):
+        for signal, slot in self._connections.pop(key, []):
+            try:
+                signal.disconnect(slot)
+            except Exception:
+                pass  # layer already deleted on the C++ side
+
+    def _watch_layer(self, lyr):
+        layer_id = lyr.id()
+        if layer_id in self._connections or layer_id in self._untracked:
+            return
+        names = LAYER_CHANGE_SIGNALS
+        if hasattr(lyr, 'featureCount'):
+            names += VECTOR_LAYER_CHANGE_SIGNALS
+        for name in names:
+            self._connect(layer_id, lyr, name, lambda *_, lid=layer_id: self.record('modified', lid))
+
+    def _on_layers_added(self, layers):
+        for lyr in layers:
+            self._watch_layer(lyr)
+            self.record('added', lyr.id())
+
+    def _on_layers_removed(self, layer_ids):
+        # Also covers takeMapLayer, where the layer outlives its removal.
+        for layer_id in layer_ids:
+            self._disconnect(layer_id)
+            self.record('removed', layer_id)
+            if layer_id in self._untracked:
+                # Its unseen changes predate this point; older versions stay full.
+                self._untracked.discard(layer_id)
+                with self._lock:
+                    self._floor = self.version
+
+    def state(self, project, since_version=None, epoch=None):
+        with self._lock:
+            version = self.version
+            entries = list(self._journal)
+            floor = self._floor
+            untracked = bool(self._untracked)
+        if (since_version is None or untracked or epoch != self.epoch
+                or since_version < floor or since_version > version):
+            return {
+                'epoch': self.epoch,
+                'version': version,
+                'full': True,
+                'project': _project_state(project),
+                'layers': [_layer_state(lyr) for lyr in project.mapLayers().values()],
+            }
+
+        first_kind = {}
+        project_changed = False
+        for v, kind, layer_id in entries:
+            if v <= since_version:
+                continue
+            if kind == 'project':
+                project_changed = True
+            else:
+                first_kind.setdefault(layer_id, kind)
+
+        current = project.mapLayers()
+        added, modified, removed = [], [], []
+        for layer_id, kind in first_kind.items():
+            lyr = current.get(layer_id)
+            if lyr is None:
+                if kind != 'added':
+                    removed.append(layer_id)
+            elif kind == 'added':
+                added.append(_layer_state(lyr))
+            else:
+                modified.append(_layer_state(lyr))
+        delta = {
+            'epoch': self.epoch,
+            'version': version,
+            'full': False,
+            'added': added,
+            'modified': modified,
+            'removed': removed,
+        }
+        if project_changed:
+            delta['project'] = _project_state(project)
+        return delta
+
+
+def _project_state(project):
+    crs = project.crs() if hasattr(project, 'crs') else None
+    return {'crs': crs.authid() if crs is not None else None}
+
+
+def _layer_summary(lyr):
+    return {
+        'id': lyr.id(),
+        'name': lyr.name(),
+        'type': lyr.type(),
+        'crs': lyr.crs().authid() if hasattr(lyr, 'crs') else None,
+    }
+
+
+def _layer_state(lyr):
+    state = _layer_summary(lyr)
+    if hasattr(lyr, 'featureCount'):
+        state['feature_count'] = lyr.featureCount()
+    if hasattr(lyr, 'extent'):
+        ext = lyr.extent()
+        state['extent'] = [ext.xMinimum(), ext.yMinimum(), ext.xMaximum(), ext.yMaximum()]
+    renderer = lyr.renderer() if hasattr(lyr, 'renderer') else None
+    if renderer is not None and hasattr(renderer, 'type'):
+        state['renderer'] = renderer.type()
+    if hasattr(lyr, 'opacity'):
+        state['opacity'] = lyr.opacity()
+    if hasattr(lyr, 'blendMode'):
+        state['blend_mode'] = int(lyr.blendMode())
+    if renderer is not None and hasattr(renderer, 'dump'):
+        # Cheap fingerprint so symbol/colour edits are visible in a delta
+        state['style_hash'] = hashlib.sha1(renderer.dump().encode('utf-8')).hexdigest()[:16]
+    return state
+
+
 class McpServer:
     def __init__(self, iface, socket_path=SOCKET_PATH):
         self.iface = iface
@@ -55,6 +248,7 @@ class McpServer:
         self.server = None
         self._runs = {}
         self._lock = Lock()
+        self._state = ProjectStateTracker()
 
     async def start(self):
         if self.socket_path.exists():
@@ -64,8 +258,10 @@ class McpServer:
                 pass
         self.server = await asyncio.start_unix_server(self.handle_client, path=self.socket_path.as_posix())
         os.chmod(self.socket_path, 0o600)
+        self._state.attach(QgsProject.instance())
 
     async def stop(self):
+        self._state.detach()
         if self.server:
             self.server.close()
             await self.server.wait_closed()
@@ -100,6 +296,8 @@ class McpServer:
             return {'result': self._list_layers()}
         if method == 'list_algorithms':
             return {'result': self._list_algs()}
+        if method == 'get_project_state':
+            return self._get_project_state(req.get('params', {}))
         if method == 'list_resources':
             return {'result': mcp_schema.resources}
         if method == 'run_processing':
@@ -115,15 +313,16 @@ class McpServer:
         return {'error': 'unknown method'}
 
     def _list_layers(self):
-        layers = []
-        for lyr in QgsProject.instance().mapLayers().values():
-            layers.append({
-                'id': lyr.id(),
-                'name': lyr.name(),
-                'type': lyr.type(),
-                'crs': lyr.crs().authid() if hasattr(lyr, 'crs') else None,
-            })
-        return layers
+        return [_layer_summary(lyr) for lyr in QgsProject.instance().mapLayers().values()]
+
+    def _get_project_state(self, params):
+        since = params.get('since_version')
+        if since is not None and (isinstance(since, bool) or not isinstance(since, int)):
+            return {'error': 'since_version must be an integer'}
+        epoch = params.get('epoch')
+        if epoch is not None and not isinstance(epoch, str):
+            return {'error': 'epoch must be a string'}
+        return {'result': self._state.state(QgsProject.instance(), since, epoch)}
 
     def _list_algs(self):
         algs = []
@@ -1,3 +1,4 @@
+import asyncio
 import importlib
 import sys
 import types
@@ -26,25 +27,62 @@ def bootstrap_qgis_stubs():
         def processingRegistry():
             return DummyRegistry()
 
+    class DummySignal:
+        def __init__(self): self.slots = []
+        def connect(self, slot): self.slots.append(slot)
+        def disconnect(self, slot): self.slots.remove(slot)
+        def emit(self, *args):
+            for slot in list(self.slots): slot(*args)
+
     class DummyLayer:
         def __init__(self, _id, name, lyr_type=0, crs='EPSG:4326'):
             self._id=_id; self._name=name; self._type=lyr_type; self._crs=types.SimpleNamespace(authid=lambda: crs)
+            for sig in ('nameChanged', 'crsChanged', 'styleChanged', 'rendererChanged', 'dataChanged', 'dataSourceChanged'):
+                setattr(self, sig, DummySignal())
         def id(self): return self._id
         def name(self): return self._name
         def type(self): return self._type
         def crs(self): return self._crs
 
+    class DummyVectorLayer(DummyLayer):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            for sig in ('layerModified', 'subsetStringChanged', 'afterCommitChanges'):
+                setattr(self, sig, DummySignal())
+        def featureCount(self): return 3
+        def extent(self):
+            return types.SimpleNamespace(xMinimum=lambda: 0.0, yMinimum=lambda: 1.0, xMaximum=lambda: 2.0, yMaximum=lambda: 3.0)
+        style = 'SINGLE: FILL SYMBOL (1 layers) color 255,0,0,255'
+        def renderer(self): return types.SimpleNamespace(type=lambda: 'singleSymbol', dump=lambda: self.style)
+        def opacity(self): return 1.0
+        def blendMode(self): return 0
+
     class DummyProjectClass:
+        _instance = None
         def __init__(self):
             self.layers = [DummyLayer('1','A')]
+            self._crs = types.SimpleNamespace(authid=lambda: 'EPSG:4326')
+            self.layersAdded = DummySignal()
+            self.layersRemoved = DummySignal()
+            self.crsChanged = DummySignal()
+            self.cleared = DummySignal()
         def mapLayers(self):
             return {lyr.id(): lyr for lyr in self.layers}
-        @staticmethod
-        def instance():
-            return DummyProjectClass()
+        def crs(self): return self._crs
+        def addMapLayer(self, lyr):
+            self.layers.append(lyr); self.layersAdded.emit([lyr])
+        def takeMapLayer(self, lyr):
+            self.layers.remove(lyr); self.layersRemoved.emit([lyr.id()])
+        @classmethod
+        def instance(cls):
+            if cls._instance is None:
+                cls._instance = cls()
+            return cls._instance
 
     core_mod = types.ModuleType('qgis.core')
-    core_mod.QgsProject = DummyProjectClass()
+    core_mod.QgsProject = DummyProjectClass.instance()
+    core_mod.DummyLayer = DummyLayer
+    core_mod.DummyVectorLayer = DummyVectorLayer
     core_mod.QgsProcessingFeedback = object
     core_mod.QgsProcessingContext = object
     core_mod.QgsApplication = DummyApplication
@@ -102,3 +140,154 @@ def test_run_script_ok():
     log = {'stdout': '', 'stderr': '', 'error': None}
     srv._sandbox_exec("print('hi')", log)
     assert 'hi' in log['stdout']
+
+
+def test_project_state_delta():
+    _, core = bootstrap_qgis_stubs()
+    server = load_server()
+    project = core.QgsProject
+    tracker = server.ProjectStateTracker()
+    tracker.attach(project)
+    full = tracker.state(project)
+    assert full['full'] and full['layers'][0]['id'] == '1'
+    assert full['project'] == {'crs': 'EPSG:4326'}
+    base = full['version']
+    epoch = full['epoch']
+
+    lyr = core.DummyVectorLayer('2', 'B')
+    project.addMapLayer(lyr)
+    project.layers[0].styleChanged.emit()
+    delta = tracker.state(project, base, epoch)
+    assert not delta['full'] and 'project' not in delta
+    assert delta['added'] == [{
+        'id': '2', 'name': 'B', 'type': 0, 'crs': 'EPSG:4326',
+        'feature_count': 3, 'extent': [0.0, 1.0, 2.0, 3.0], 'renderer': 'singleSymbol',
+        'opacity': 1.0, 'blend_mode': 0, 'style_hash': delta['added'][0]['style_hash'],
+    }]
+    assert [l['id'] for l in delta['modified']] == ['1']
+
+    old_hash = delta['added'][0]['style_hash']
+    since = delta['version']
+    lyr.style = 'SINGLE: FILL SYMBOL (1 layers) color 0,0,255,255'
+    lyr.rendererChanged.emit()
+    delta = tracker.state(project, since, epoch)
+    assert [l['id'] for l in delta['modified']] == ['2']
+    assert delta['modified'][0]['style_hash'] != old_hash
+
+    project.takeMapLayer(lyr)
+    delta = tracker.state(project, delta['version'], epoch)
+    assert delta['removed'] == ['2'] and not delta['added']
+    # added then removed within the window nets out
+    assert tracker.state(project, base, epoch)['removed'] == []
+    # removed layers are no longer watched
+    assert not lyr.dataChanged.slots
+
+    project.crsChanged.emit()
+    assert 'project' in tracker.state(project, delta['version'], epoch)
+
+    tracker.detach()
+    assert not project.layersAdded.slots and not project.layers[0].nameChanged.slots
+
+
+def test_project_state_vector_edit_signals():
+    _, core = bootstrap_qgis_stubs()
+    server = load_server()
+    project = core.QgsProject
+    lyr = core.DummyVectorLayer('2', 'B')
+    project.layers.append(lyr)
+    tracker = server.ProjectStateTracker()
+    tracker.attach(project)
+    since = tracker.version
+    lyr.layerModified.emit()
+    delta = tracker.state(project, since, tracker.epoch)
+    assert not delta['full']
+    assert [l['id'] for l in delta['modified']] == ['2']
+    since = tracker.version
+    lyr.subsetStringChanged.emit()
+    assert tracker.state(project, since, tracker.epoch)['modified']
+
+
+def test_project_state_untracked_layer_forces_full():
+    _, core = bootstrap_qgis_stubs()
+    server = load_server()
+    project = core.QgsProject
+    lyr = core.DummyLayer('2', 'B')
+    del lyr.styleChanged
+    project.layers.append(lyr)
+    tracker = server.ProjectStateTracker()
+    tracker.attach(project)
+    assert tracker.state(project, tracker.version, tracker.epoch)['full']
+    before = tracker.version
+    project.takeMapLayer(lyr)
+    assert tracker.state(project, before, tracker.epoch)['full']
+    assert not tracker.state(project, tracker.version, tracker.epoch)['full']
+
+
+def test_project_state_readded_layer_watched_once():
+    _, core = bootstrap_qgis_stubs()
+    server = load_server()
+    project = core.QgsProject
+    tracker = server.ProjectStateTracker()
+    tracker.attach(project)
+    lyr = project.layers[0]
+    project.takeMapLayer(lyr)
+    project.addMapLayer(lyr)
+    before = tracker.version
+    lyr.nameChanged.emit()
+    assert tracker.version == before + 1
+    assert len(lyr.nameChanged.slots) == 1
+
+
+def test_project_state_cleared_forces_full():
+    _, core = bootstrap_qgis_stubs()
+    server = load_server()
+    project = core.QgsProject
+    tracker = server.ProjectStateTracker()
+    tracker.attach(project)
+    project.layers[0].dataChanged.emit()
+    since = tracker.version
+    project.cleared.emit()
+    assert tracker.state(project, since, tracker.epoch)['full']
+
+
+def test_get_project_state_dispatch():
+    bootstrap_qgis_stubs()
+    server = load_server()
+    srv = server.McpServer(iface=None)
+    resp = asyncio.run(srv.dispatch({'method': 'get_project_state', 'params': {}}))
+    state = resp['result']
+    assert state['full'] and [l['name'] for l in state['layers']] == ['A']
+    params = {'since_version': state['version'], 'epoch': state['epoch']}
+    resp = asyncio.run(srv.dispatch({'method': 'get_project_state', 'params': params}))
+    assert resp['result']['full'] is False
+    for bad in ('3', True, 1.5):
+        resp = asyncio.run(srv.dispatch({'method': 'get_project_state', 'params': {'since_version': bad}}))
+        assert resp['error'] == 'since_version must be an integer'
+
+
+def test_project_state_truncated_journal():
+    bootstrap_qgis_stubs()
+    server = load_server()
+    project = sys.modules['qgis.core'].QgsProject
+    tracker = server.ProjectStateTracker(journal_size=2)
+    epoch = tracker.epoch
+    for _ in range(3):
+        tracker.record('modified', '1')
+    assert tracker.state(project, 0, epoch)['full']
+    assert not tracker.state(project, 1, epoch)['full']
+    tracker.reset()
+    assert tracker.state(project, 3, epoch)['full']
+    assert not tracker.state(project, tracker.version, epoch)['full']
+
+
+def test_project_state_epoch_mismatch():
+    bootstrap_qgis_stubs()
+    server = load_server()
+    project = sys.modules['qgis.core'].QgsProject
+    old = server.ProjectStateTracker()
+    new = server.ProjectStateTracker()
+    for _ in range(7):
+        new.record('modified', '1')
+    assert new.state(project, 3, old.epoch)['full']
+    assert new.state(project, 3)['full']
+    assert not new.state(project, 3, new.epoch)['full']